@@ -129,6 +129,7 @@ class NexiosApp(object):
         self.exceptions_handler = ExceptionMiddleware()
         self.server_error_handler = server_error_handler
         self._background_tasks = set()
+        self._composed_http_app: Optional[ASGIApp] = None
 
         self.app = Router(routes=routes, dependencies=self.dependencies)  # type:ignore
         self.router = self.app
@@ -377,6 +378,7 @@ class NexiosApp(object):
             0,
             Middleware(ASGIRequestResponseBridge, dispatch=middleware),  # type:ignore
         )
+        self._composed_http_app = None
 
     def add_ws_route(
         self,
@@ -517,21 +519,28 @@ class NexiosApp(object):
         self.ws_middleware.append(middleware)
 
     def handle_http_request(self, scope: Scope, receive: Receive, send: Send):
-        app = self.app
-        middleware = (
-            [
-                Middleware(
-                    ASGIRequestResponseBridge,
-                    dispatch=ServerErrorMiddleware(handler=self.server_error_handler),
-                )
-            ]
-            + self.http_middleware
-            + [
-                Middleware(ASGIRequestResponseBridge, dispatch=self.exceptions_handler)  # type:ignore
-            ]
-        )
-        for cls, args, kwargs in reversed(middleware):
-            app = cls(app, *args, **kwargs)
+        # The composed middleware chain is rebuilt only when the middleware
+        # list or the underlying ASGI app changes, not on every request.
+        app = self._composed_http_app
+        if app is None:
+            app = self.app
+            middleware = (
+                [
+                    Middleware(
+                        ASGIRequestResponseBridge,
+                        dispatch=ServerErrorMiddleware(
+                            handler=self.server_error_handler
+                        ),
+                    )
+                ]
+                + self.http_middleware
+                + [
+                    Middleware(ASGIRequestResponseBridge, dispatch=self.exceptions_handler)  # type:ignore
+                ]
+            )
+            for cls, args, kwargs in reversed(middleware):
+                app = cls(app, *args, **kwargs)
+            self._composed_http_app = app
         return app(scope, receive, send)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
@@ -2204,8 +2213,20 @@ class NexiosApp(object):
 
         """
         self.app = middleware_cls(self.app, **kwargs)
+        self._composed_http_app = None
         return None
 
+    def invalidate_caches(self) -> None:
+        """
+        Resets the composed middleware chain and the router's matching caches.
+
+        The registration APIs invalidate these automatically; call this after
+        mutating ``router.routes`` or ``http_middleware`` directly so requests
+        are not served from stale state.
+        """
+        self._composed_http_app = None
+        self.router.invalidate_caches()
+
     def get_all_routes(self) -> List[Routes]:
         """
         Returns all routes registered in the application.
@@ -1,14 +1,115 @@
+import base64
+import copy
+import hashlib
+import hmac
+import json
+import threading
+import time
+from functools import lru_cache
+
 try:
     import jwt
 except ImportError:
     jwt = None
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from nexios.auth.base import AuthenticationBackend, UnauthenticatedUser
 from nexios.config import get_config
 from nexios.http import Request, Response
 
 
+# Verified tokens keyed by (token, secret, algorithms). Real clients resend the same
+# bearer token on every request of a session, so caching the decoded
+# payload skips the signature check and JSON parse on repeats. Entries
+# expire after a short TTL and the token's own exp is still enforced on
+# every hit.
+_DECODE_CACHE: Dict[
+    Tuple[str, str, Tuple[str, ...]], Tuple[float, Dict[str, Any]]
+] = {}
+_DECODE_CACHE_MAX = 4096
+_DECODE_CACHE_TTL = 60.0
+_decode_cache_lock = threading.Lock()
+
+
+def _b64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+_HS256_HEADER = _b64url_encode(
+    json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode()
+)
+
+
+@lru_cache(maxsize=32)
+def _hmac_template(secret: str) -> "hmac.HMAC":
+    """Keyed HMAC-SHA256 state for a secret.
+
+    Keying an HMAC runs two SHA-256 compressions; signing via ``.copy()`` of
+    a cached template skips that setup on every call with the same secret.
+    """
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+def _sign_hs256(secret: str, signing_input: bytes) -> bytes:
+    mac = _hmac_template(secret).copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _decode_hs256_fast(token: str, secret: str) -> Dict[str, Any]:
+    """Verify and decode an HS256 token without PyJWT's algorithm dispatch.
+
+    Inline base64 split, hmac.compare_digest against the recomputed
+    signature, and json.loads; raises the same ValueErrors decode_jwt
+    has always raised.
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        header = json.loads(_b64url_decode(header_b64))
+        signature = _b64url_decode(signature_b64)
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid token")
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise ValueError("Invalid token")
+    expected = _sign_hs256(secret, f"{header_b64}.{payload_b64}".encode("ascii"))
+    if not hmac.compare_digest(expected, signature):
+        raise ValueError("Invalid token")
+    try:
+        payload = json.loads(_b64url_decode(payload_b64))
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid token")
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid token")
+    if "aud" in payload:
+        # PyJWT rejects audience-restricted tokens unless the caller
+        # supplies an audience to match, and decode_jwt never does.
+        raise ValueError("Invalid token")
+    sub = payload.get("sub")
+    if sub is not None and not isinstance(sub, str):
+        raise ValueError("Invalid token")
+    jti = payload.get("jti")
+    if jti is not None and not isinstance(jti, str):
+        raise ValueError("Invalid token")
+    now = time.time()
+    nbf = payload.get("nbf")
+    exp = payload.get("exp")
+    try:
+        if nbf is not None and now < nbf:
+            raise ValueError("Invalid token")
+        if exp is not None and now >= exp:
+            raise ValueError("Token has expired")
+    except TypeError:
+        # Non-numeric exp/nbf in a correctly signed token; PyJWT rejects
+        # these too, so keep the error contract rather than leaking a
+        # TypeError past callers that only catch ValueError.
+        raise ValueError("Invalid token")
+    return payload
+
+
 def create_jwt(
     payload: Dict[str, Any], secret: Optional[str] = None, algorithm: str = "HS256"
 ) -> str:
@@ -24,6 +125,18 @@ def create_jwt(
     if jwt is None:
         raise ImportError("JWT support is not installed.")
     secret = secret or get_config().secret_key
+    if algorithm == "HS256":
+        try:
+            payload_b64 = _b64url_encode(
+                json.dumps(payload, separators=(",", ":")).encode()
+            )
+        except (TypeError, ValueError):
+            # Claims PyJWT knows how to coerce (e.g. datetime exp) fall back
+            # to the generic encoder.
+            return jwt.encode(payload, secret, algorithm=algorithm)  # type:ignore
+        signing_input = f"{_HS256_HEADER}.{payload_b64}"
+        signature = _sign_hs256(secret, signing_input.encode("ascii"))
+        return f"{signing_input}.{_b64url_encode(signature)}"
     return jwt.encode(payload, secret, algorithm=algorithm)  # type:ignore
 
 
@@ -42,12 +155,44 @@ def decode_jwt(
     if jwt is None:
         raise ImportError("JWT support is not installed.")
     secret = secret or get_config().secret_key
-    try:
-        return jwt.decode(token, secret, algorithms=algorithms)  # type:ignore
-    except jwt.ExpiredSignatureError:  # type:ignore
-        raise ValueError("Token has expired")  # type:ignore
-    except jwt.InvalidTokenError:  # type:ignore
-        raise ValueError("Invalid token")
+
+    now = time.time()
+    # The algorithm list is part of the verification contract, so a token
+    # accepted under one list must not satisfy a lookup under another.
+    cache_key = (token, secret, tuple(algorithms))
+    entry = _DECODE_CACHE.get(cache_key)
+    if entry is not None and now < entry[0]:
+        payload = entry[1]
+        exp = payload.get("exp")
+        if exp is not None and now >= exp:
+            raise ValueError("Token has expired")
+        # Deep copy: nested claim values (scopes, roles) must not alias
+        # the cached payload, or one handler's mutation would leak into
+        # every later request with the same token.
+        return copy.deepcopy(payload)
+
+    if algorithms == ["HS256"] or algorithms == ("HS256",):
+        # The overwhelmingly common single-algorithm case skips PyJWT's
+        # per-algorithm class lookup entirely.
+        payload = _decode_hs256_fast(token, secret)
+    else:
+        try:
+            payload = jwt.decode(token, secret, algorithms=algorithms)  # type:ignore
+        except jwt.ExpiredSignatureError:  # type:ignore
+            raise ValueError("Token has expired")  # type:ignore
+        except jwt.InvalidTokenError:  # type:ignore
+            raise ValueError("Invalid token")
+
+    with _decode_cache_lock:
+        if len(_DECODE_CACHE) >= _DECODE_CACHE_MAX:
+            for key in [k for k, v in _DECODE_CACHE.items() if v[0] <= now]:
+                del _DECODE_CACHE[key]
+            while len(_DECODE_CACHE) >= _DECODE_CACHE_MAX:
+                del _DECODE_CACHE[next(iter(_DECODE_CACHE))]
+        # The cache keeps its own deep copy so neither this caller's
+        # return value nor later hits share nested structures with it.
+        _DECODE_CACHE[cache_key] = (now + _DECODE_CACHE_TTL, copy.deepcopy(payload))
+    return payload
 
 
 class JWTAuthBackend(AuthenticationBackend):
@@ -64,7 +209,9 @@ class JWTAuthBackend(AuthenticationBackend):
             response.set_header("WWW-Authenticate", 'Bearer realm="Access to the API"')
             return None
 
-        token = auth_header.split(" ")[1]
+        # startswith already proved the prefix; slice past "Bearer "
+        # instead of re-scanning the header with split.
+        token = auth_header[7:]
         try:
             payload = decode_jwt(token, self.secret, self.algorithms)
         except ValueError as _:
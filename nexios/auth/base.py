@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import typing
 
 from typing_extensions import Annotated, Doc
@@ -148,6 +149,26 @@ class SimpleUser(BaseUser):
         self.username = username
         self.permissions = permissions
 
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def get(
+        cls, username: Annotated[str, Doc("The username of the authenticated user.")]
+    ) -> "SimpleUser":
+        """
+        Returns a cached user instance for a username.
+
+        The same identities recur request after request; memoizing the
+        constructor hands back one shared instance per username instead
+        of allocating a new object each time.
+
+        Args:
+            username (str): The username of the user.
+
+        Returns:
+            SimpleUser: The cached user instance for that username.
+        """
+        return cls(username)
+
     @property
     def is_authenticated(
         self,
@@ -1,9 +1,9 @@
-import inspect
 import typing
 from functools import wraps
 
 from nexios.decorators import RouteDecorator
 from nexios.http import Request, Response
+from nexios.utils.async_helpers import cached_iscoroutinefunction
 
 from .exceptions import AuthenticationFailed, PermissionDenied
 
@@ -28,11 +28,21 @@ class auth(RouteDecorator):
         if getattr(handler, "_is_wrapped", False):
             return handler
 
+        is_coro = cached_iscoroutinefunction(handler)
+        scopes = self.scopes
+
         @wraps(handler)  # type: ignore
         async def wrapper(
             *args: typing.List[typing.Any], **kwargs: typing.Dict[str, typing.Any]
         ) -> typing.Any:
-            request, response, *_ = kwargs.values()
+            if len(args) >= 2:
+                request, response = args[0], args[1]
+            else:
+                # Handlers are invoked with keyword arguments bound in
+                # signature order; take the first two without materializing
+                # the rest.
+                values = iter(kwargs.values())
+                request, response = next(values), next(values)
 
             if not isinstance(request, Request) or not isinstance(response, Response):
                 raise TypeError("Expected request and response as the fist arguments")
@@ -42,10 +52,10 @@ class auth(RouteDecorator):
 
             scope = request.scope.get("auth")  # type: ignore
 
-            if self.scopes and scope not in self.scopes:
+            if scopes and scope not in scopes:
                 raise AuthenticationFailed
 
-            if inspect.iscoroutinefunction(handler):
+            if is_coro:
                 return await handler(*args, **kwargs)
             return handler(*args, **kwargs)
 
@@ -73,11 +83,21 @@ class has_permission(RouteDecorator):
         if getattr(handler, "_is_wrapped", False):
             return handler
 
+        is_coro = cached_iscoroutinefunction(handler)
+        permissions = self.permissions
+
         @wraps(handler)  # type: ignore
         async def wrapper(
             *args: typing.List[typing.Any], **kwargs: typing.Dict[str, typing.Any]
         ) -> typing.Any:
-            request, response, *_ = kwargs.values()
+            if len(args) >= 2:
+                request, response = args[0], args[1]
+            else:
+                # Handlers are invoked with keyword arguments bound in
+                # signature order; take the first two without materializing
+                # the rest.
+                values = iter(kwargs.values())
+                request, response = next(values), next(values)
 
             if not isinstance(request, Request) or not isinstance(response, Response):
                 raise TypeError("Expected request and response as the fist arguments")
@@ -86,11 +106,11 @@ class has_permission(RouteDecorator):
                 raise AuthenticationFailed
 
             user = request.user
-            for permission in self.permissions:
+            for permission in permissions:
                 if not user.has_permission(permission):
                     raise PermissionDenied
 
-            if inspect.iscoroutinefunction(handler):
+            if is_coro:
                 return await handler(*args, **kwargs)
             return handler(*args, **kwargs)
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import inspect
 import typing
 
 from typing_extensions import Annotated, Doc
@@ -8,6 +7,7 @@ from typing_extensions import Annotated, Doc
 from nexios import logging
 from nexios.http import Request, Response
 from nexios.middleware.base import BaseMiddleware
+from nexios.utils.async_helpers import cached_iscoroutinefunction
 
 from .base import AuthenticationBackend, UnauthenticatedUser
 
@@ -76,7 +76,7 @@ class AuthenticationMiddleware(BaseMiddleware):
         # Try each backend until one successfully authenticates the user
         for backend in self.backends:
             try:
-                if inspect.iscoroutinefunction(backend.authenticate):
+                if cached_iscoroutinefunction(backend.authenticate):
                     user = await backend.authenticate(request, response)
                 else:
                     user = backend.authenticate(request, response)  # type: ignore
@@ -934,7 +934,7 @@ class AsyncEventEmitter(EventEmitter):
         Returns:
             Dictionary with execution statistics
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             self._executor, lambda: self.emit(event_name, *args, **kwargs)
         )
@@ -953,7 +953,7 @@ class AsyncEventEmitter(EventEmitter):
         Returns:
             Future representing the eventual execution
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return loop.run_in_executor(
             self._executor, lambda: self.emit(event_name, *args, **kwargs)
         )
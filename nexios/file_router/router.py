@@ -91,31 +91,32 @@ class FileRouter:
             if is_route:
                 handler_function = getattr(module, attr_name)
                 logger.debug(f"Mapped {attr_name} {path}")
-                path = getattr(handler_function, "_path", path.replace("\\", "/"))
+                meta = getattr(handler_function, "_nexios_route_meta", None)
+                path = meta.path if meta else path.replace("\\", "/")
                 if attr_name in ["get", "post", "patch", "put", "delete"]:
                     methods = [attr_name.upper()]
                 else:
-                    methods = getattr(handler_function, "_allowed_methods", ["GET"])
+                    methods = meta.methods if meta else ["GET"]
                 handlers.append(
                     Routes(
                         path=path.rstrip("/") if self.restrict_slash(path) else path,
                         handler=handler_function,  # type:ignore
                         methods=methods,
-                        name=getattr(handler_function, "_name", ""),
-                        summary=getattr(handler_function, "_summary", ""),
-                        description=getattr(handler_function, "_description", ""),
-                        responses=getattr(handler_function, "_responses", {}),
-                        request_model=getattr(handler_function, "_request_model", None),
-                        middleware=getattr(handler_function, "_middleware", []),
-                        tags=getattr(handler_function, "_tags", []),
-                        security=getattr(handler_function, "_security", []),
-                        operation_id=getattr(handler_function, "_operation_id", ""),
-                        deprecated=getattr(handler_function, "_deprecated", False),
-                        parameters=getattr(handler_function, "_parameters", []),
-                        exclude_from_schema=getattr(
-                            handler_function,
-                            "_exclude_from_schema",
-                            self.config.get("exclude_from_schema", False),
+                        name=meta.name if meta else "",
+                        summary=meta.summary if meta else "",
+                        description=meta.description if meta else "",
+                        responses=meta.responses if meta else {},
+                        request_model=meta.request_model if meta else None,
+                        middleware=meta.middleware if meta else [],
+                        tags=meta.tags if meta else [],
+                        security=meta.security if meta else [],
+                        operation_id=meta.operation_id if meta else "",
+                        deprecated=meta.deprecated if meta else False,
+                        parameters=meta.parameters if meta else [],
+                        exclude_from_schema=(
+                            meta.exclude_from_schema
+                            if meta
+                            else self.config.get("exclude_from_schema", False)
                         ),  # type: ignore
                     )
                 )
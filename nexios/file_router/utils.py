@@ -1,13 +1,37 @@
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Type
 
 from pydantic import BaseModel
 
 from nexios.openapi.models import Parameter
 
+# Already lowercased, so the default case skips re-lowering per decoration.
+_DEFAULT_METHODS: List[str] = ["get", "post", "patch", "put", "delete"]
+
+
+@dataclass(slots=True)
+class RouteMeta:
+    """Routing metadata attached to a handler by :func:`mark_as_route`."""
+
+    path: str
+    methods: List[str]
+    name: str
+    summary: str = ""
+    description: str = ""
+    responses: Dict[int, Any] = field(default_factory=dict)
+    request_model: Optional[Type[BaseModel]] = None
+    middleware: List[Any] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    security: List[Dict[str, List[str]]] = field(default_factory=list)
+    operation_id: str = ""
+    deprecated: bool = False
+    parameters: List[Parameter] = field(default_factory=list)
+    exclude_from_schema: bool = False
+
 
 def mark_as_route(
     path: str,
-    methods: List[str] = ["get", "post", "patch", "put", "delete"],
+    methods: List[str] = _DEFAULT_METHODS,
     name: Optional[str] = None,
     summary: Optional[str] = None,
     description: Optional[str] = None,
@@ -22,22 +46,29 @@ def mark_as_route(
     exclude_from_schema: bool = False,
 ):
     def decorator(func):
-        # Use setattr to set attributes dynamically
-        setattr(func, "_is_route", True)
-        setattr(func, "_path", path)
-        setattr(func, "_allowed_methods", [method.lower() for method in methods])
-        setattr(func, "_name", name or func.__name__)
-        setattr(func, "_summary", summary or "")
-        setattr(func, "_description", description or "")
-        setattr(func, "_responses", responses or {})
-        setattr(func, "_request_model", request_model)
-        setattr(func, "_middleware", middleware)
-        setattr(func, "_tags", tags or [])
-        setattr(func, "_security", security or [])
-        setattr(func, "_operation_id", operation_id or func.__name__)
-        setattr(func, "_deprecated", deprecated)
-        setattr(func, "_parameters", parameters)
-        setattr(func, "_exclude_from_schema", exclude_from_schema)
+        # A single metadata object instead of one attribute per field: one
+        # dict write at decoration time, one attribute read per consumer.
+        func._is_route = True
+        func._nexios_route_meta = RouteMeta(
+            path=path,
+            methods=(
+                list(_DEFAULT_METHODS)
+                if methods is _DEFAULT_METHODS
+                else [method.lower() for method in methods]
+            ),
+            name=name or func.__name__,
+            summary=summary or "",
+            description=description or "",
+            responses=responses or {},
+            request_model=request_model,
+            middleware=middleware,
+            tags=tags or [],
+            security=security or [],
+            operation_id=operation_id or func.__name__,
+            deprecated=deprecated,
+            parameters=parameters,
+            exclude_from_schema=exclude_from_schema,
+        )
 
         return func
 
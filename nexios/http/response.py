@@ -1,6 +1,7 @@
 import hashlib
 import http.cookies
 import json
+import math
 import mimetypes
 import os
 import stat
@@ -18,6 +19,11 @@ import anyio
 import anyio.to_thread
 from anyio import AsyncFile
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from nexios.http.request import ClientDisconnect, Request
 from nexios.pagination import (
     AsyncListDataHandler,
@@ -253,6 +259,25 @@ class PlainTextResponse(BaseResponse):
         super().__init__(body, status_code, headers, content_type)
 
 
+def _contains_non_finite(value: Any) -> bool:
+    """True if any float anywhere in ``value`` is NaN or infinite.
+
+    The stdlib encoder rejects these (``allow_nan=False``) while orjson
+    silently emits ``null``; scanning first keeps the two paths raising
+    identically.
+    """
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(
+            _contains_non_finite(k) or _contains_non_finite(v)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return any(_contains_non_finite(item) for item in value)
+    return False
+
+
 class JSONResponse(BaseResponse):
     """
     Response subclass for JSON content.
@@ -266,16 +291,38 @@ class JSONResponse(BaseResponse):
         indent: Optional[int] = None,
         ensure_ascii: bool = True,
     ):
-        try:
-            body = json.dumps(
-                content,
-                indent=indent,
-                ensure_ascii=ensure_ascii,
-                allow_nan=False,
-                default=str,
-            )
-        except (TypeError, ValueError) as e:
-            raise ValueError(f"Content is not JSON serializable: {str(e)}")
+        body: Union[str, bytes, None] = None
+        if orjson is not None and indent is None and not _contains_non_finite(content):
+            # orjson serializes in C and returns UTF-8 bytes, which
+            # render() passes straight through without an encode pass.
+            # OPT_NON_STR_KEYS coerces non-string dict keys and
+            # OPT_PASSTHROUGH_DATETIME routes datetimes through
+            # default=str, matching what the stdlib encoder accepts and
+            # emits. Anything orjson still refuses falls back to the
+            # stdlib path below rather than changing which payloads are
+            # serializable, as does output that ensure_ascii requires
+            # escaped.
+            try:
+                rendered = orjson.dumps(
+                    content,
+                    default=str,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+                )
+            except (TypeError, ValueError):
+                rendered = None
+            if rendered is not None and not (ensure_ascii and not rendered.isascii()):
+                body = rendered
+        if body is None:
+            try:
+                body = json.dumps(
+                    content,
+                    indent=indent,
+                    ensure_ascii=ensure_ascii,
+                    allow_nan=False,
+                    default=str,
+                )
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Content is not JSON serializable: {str(e)}")
 
         super().__init__(
             body=body,
@@ -5,6 +5,7 @@ import inspect
 import re
 import typing
 import warnings
+from collections import OrderedDict
 from typing import (
     Annotated,
     Any,
@@ -181,6 +182,7 @@ class Routes(BaseRoute):
         self.raw_path = path
         self.handler = inject_dependencies(handler)
         self.methods = methods or allowed_methods_default
+        self._methods_lower = frozenset(m.lower() for m in self.methods)
         self.name = name
 
         self.route_info = RouteBuilder.create_pattern(path)
@@ -221,7 +223,7 @@ class Routes(BaseRoute):
                 matched_params[key] = self.route_info.convertor[  # type: ignore
                     key
                 ].convert(value)
-            is_method_allowed = method.lower() in (m.lower() for m in self.methods)
+            is_method_allowed = method.lower() in self._methods_lower
             return match, matched_params, is_method_allowed
         return None, None, False
 
@@ -308,6 +310,13 @@ class Router(BaseRouter):
         self.prefix = prefix or ""
         self.prefix.rstrip("/")
         self.routes = []
+        self._combined_re: Optional[typing.Pattern[str]] = None
+        self._combined_stale = True
+        self._route_cache: "OrderedDict[typing.Tuple[str, str], typing.Tuple[Routes, typing.Dict[str, Any]]]" = OrderedDict()
+        self._route_cache_max = 4096
+        self._composed_stack: Optional[ASGIApp] = None
+        self._routes_by_method: Optional[Dict[str, List[Routes]]] = None
+        self._buckets_stale = True
         self.middleware: typing.List[Middleware] = []
         self.sub_routers: Dict[str, Union[Router, ASGIApp]] = {}
         self.route_class = Routes
@@ -547,6 +556,7 @@ class Router(BaseRouter):
 
         if not isinstance(route, Routes):
             self.routes.append(route)
+            self.invalidate_caches()
             return
 
         route.tags = self.tags + route.tags if route.tags else self.tags
@@ -576,12 +586,25 @@ class Router(BaseRouter):
         route.handler = wrapped_handler
 
         self.routes.append(route)
+        self.invalidate_caches()
+
+    def invalidate_caches(self) -> None:
+        """
+        Drops the derived route-matching caches.
+
+        Registration APIs call this automatically; call it after mutating
+        ``routes`` directly so lookups do not serve stale matches.
+        """
+        self._combined_stale = True
+        self._buckets_stale = True
+        self._route_cache.clear()
 
     def add_middleware(self, middleware: MiddlewareType) -> None:
         """Add middleware to the router"""
         if callable(middleware):
             mdw = Middleware(ASGIRequestResponseBridge, dispatch=middleware)  # type: ignore
             self.middleware.insert(0, mdw)
+            self._composed_stack = None
 
     def get(
         self,
@@ -2234,9 +2257,75 @@ class Router(BaseRouter):
         receive: Receive,
         send: Send,
     ) -> Any:
-        app = self.build_middleware_stack(self.app)
+        # Rebuilt only when the middleware list changes; steady-state
+        # requests reuse the composed stack.
+        app = self._composed_stack
+        if app is None:
+            app = self._composed_stack = self.build_middleware_stack(self.app)
         await app(scope, receive, send)
 
+    def _combined_pattern(self) -> Optional[typing.Pattern[str]]:
+        """
+        Return a single regex that matches any registered route path.
+
+        All route patterns are joined into one alternation so a request can
+        be matched with one C-level regex call instead of one call per
+        route. Inner named groups are rewritten to non-capturing groups to
+        avoid duplicate-name collisions; each alternative is wrapped in a
+        ``r<index>`` group so ``lastgroup`` identifies the winning route.
+        Returns ``None`` when the route table cannot be combined (custom
+        route classes or a pattern the regex engine rejects), in which case
+        callers fall back to the linear scan.
+        """
+        if self._combined_stale:
+            self._combined_stale = False
+            self._combined_re = None
+            if self.routes and all(isinstance(r, Routes) for r in self.routes):
+                parts = [
+                    "(?P<r{}>{})".format(
+                        index, re.sub(r"\(\?P<\w+>", "(?:", route.pattern.pattern)
+                    )
+                    for index, route in enumerate(self.routes)
+                ]
+                try:
+                    self._combined_re = re.compile("|".join(parts))
+                except re.error:
+                    self._combined_re = None
+        return self._combined_re
+
+    def _method_buckets(
+        self,
+    ) -> Optional[Dict[str, List[Routes]]]:
+        """
+        Routes grouped by lowercased HTTP method, rebuilt on route changes.
+
+        Returns ``None`` when the table contains custom route classes, in
+        which case the caller scans the full list.
+        """
+        if self._buckets_stale:
+            self._buckets_stale = False
+            if all(isinstance(r, Routes) for r in self.routes):
+                buckets: Dict[str, List[Routes]] = {}
+                for route in self.routes:
+                    for method in route._methods_lower:
+                        buckets.setdefault(method, []).append(route)
+                self._routes_by_method: Optional[Dict[str, List[Routes]]] = buckets
+            else:
+                self._routes_by_method = None
+        return self._routes_by_method
+
+    def _remember_match(
+        self,
+        key: typing.Tuple[str, str],
+        route: Routes,
+        params: typing.Dict[str, Any],
+    ) -> None:
+        """Store a resolved (path, method) match, evicting the oldest entry."""
+        cache = self._route_cache
+        cache[key] = (route, dict(params))
+        if len(cache) > self._route_cache_max:
+            cache.popitem(last=False)
+
     async def app(self, scope: Scope, receive: Receive, send: Send):
         scope["app"] = self
         url = get_route_path(scope)
@@ -2248,13 +2337,67 @@ class Router(BaseRouter):
 
                 return
 
+        cache_key = (url, scope["method"])
+        cached = self._route_cache.get(cache_key)
+        if cached is not None:
+            self._route_cache.move_to_end(cache_key)
+            route, params = cached
+            scope["route_params"] = RouteParam(dict(params))
+            await route.handle(scope, receive, send)
+            return
+
+        combined = self._combined_pattern()
+        if combined is not None:
+            combined_match = combined.match(url)
+            if combined_match is None:
+                raise NotFoundException
+            route = self.routes[int(combined_match.lastgroup[1:])]  # type: ignore[index]
+            match, matched_params, is_allowed = route.match(url, scope["method"])
+            if match and is_allowed:
+                self._remember_match(cache_key, route, matched_params)
+                scope["route_params"] = RouteParam(matched_params)
+                await route.handle(scope, receive, send)
+                return
+            # Path matched but the method is not allowed; fall through to
+            # the linear scan so 405 responses still aggregate the allowed
+            # methods across every route sharing this path.
+
+        method = scope["method"]
+        buckets = self._method_buckets()
+        if buckets is not None:
+            # Only routes that actually allow this method are candidates for
+            # dispatch; the full table is consulted afterwards purely to
+            # distinguish 404 from 405.
+            for route in buckets.get(method.lower(), ()):
+                match, matched_params, is_allowed = route.match(url, method)
+                if match and is_allowed:
+                    self._remember_match(cache_key, route, matched_params)
+                    scope["route_params"] = RouteParam(matched_params)
+                    await route.handle(scope, receive, send)
+                    return
+            allowed_methods_ = set()
+            for route in self.routes:
+                match, _, _ = route.match(url, method)
+                if match:
+                    allowed_methods_.update(route.methods)
+            if allowed_methods_:
+                response = JSONResponse(
+                    content="Method not allowed",
+                    status_code=405,
+                    headers={"Allow": ", ".join(allowed_methods_)},
+                )
+                await response(scope, receive, send)
+                return
+            raise NotFoundException
+
         path_matched = False
-        allowed_methods_: typing.Set[str] = set()
+        allowed_methods_ = set()
         for route in self.routes:
-            match, matched_params, is_allowed = route.match(url, scope["method"])
+            match, matched_params, is_allowed = route.match(url, method)
             if match:
                 path_matched = True
                 if is_allowed:
+                    self._remember_match(cache_key, route, matched_params)
                     scope["route_params"] = RouteParam(matched_params)
                     await route.handle(scope, receive, send)
                     return
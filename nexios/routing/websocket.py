@@ -1,4 +1,3 @@
-import asyncio
 import typing
 import warnings
 from typing import Any, Callable, Dict, List, Optional
@@ -7,6 +6,7 @@ from typing_extensions import Annotated, Doc
 
 from nexios._internals._route_builder import RouteBuilder
 from nexios.dependencies import inject_dependencies
+from nexios.utils.async_helpers import cached_iscoroutinefunction
 from nexios.types import (
     ASGIApp,
     Receive,
@@ -30,7 +30,7 @@ class WebsocketRoutes:
         middleware: typing.List[WsMiddlewareType] = [],
     ):
         assert callable(handler), "Route handler must be callable"
-        assert asyncio.iscoroutinefunction(handler), "Route handler must be async"
+        assert cached_iscoroutinefunction(handler), "Route handler must be async"
         self.raw_path = path
         self.handler: WsHandlerType = inject_dependencies(handler)
         self.middleware = middleware
@@ -39,6 +39,12 @@ class WebsocketRoutes:
         self.param_names = self.route_info.param_names
         self.route_type = self.route_info.route_type
         self.router_middleware = None
+        # Ordered (name, convert) pairs resolved once so matching does not
+        # re-do a convertor dict lookup per parameter per connection.
+        self._converters = [
+            (name, self.route_info.convertor[name].convert)  # type:ignore
+            for name in self.param_names
+        ]
 
     def match(self, path: str) -> typing.Tuple[Any, Any]:
         """
@@ -53,11 +59,11 @@ class WebsocketRoutes:
         """
         match = self.pattern.match(path)
         if match:
-            matched_params = match.groupdict()
-            for key, value in matched_params.items():
-                matched_params[key] = self.route_info.convertor[  # type:ignore
-                    key
-                ].convert(value)
+            # Pull groups by name: convertor regexes may contain their own
+            # capturing groups, so positional groups() would misalign.
+            matched_params = {
+                name: convert(match.group(name)) for name, convert in self._converters
+            }
             return match, matched_params
         return None, None
 
@@ -87,6 +93,10 @@ class WSRouter(BaseRouter):
         self.routes: List[WebsocketRoutes] = routes or []
         self.middleware: List[Callable[[ASGIApp], ASGIApp]] = []
         self.sub_routers: Dict[str, ASGIApp] = {}
+        self._composed_app: Optional[ASGIApp] = None
+        self._mounts_by_length: Optional[
+            typing.Tuple[typing.Tuple[str, ASGIApp], ...]
+        ] = None
         if self.prefix and not self.prefix.startswith("/"):
             warnings.warn("WSRouter prefix should start with '/'")
             self.prefix = f"/{self.prefix}"
@@ -130,6 +140,7 @@ class WSRouter(BaseRouter):
     def add_ws_middleware(self, middleware: type[ASGIApp]) -> None:  # type: ignore[override]
         """Add middleware to the WebSocket router"""
         self.middleware.insert(0, middleware)  # type: ignore
+        self._composed_app = None
 
     def ws_route(
         self,
@@ -188,13 +199,28 @@ class WSRouter(BaseRouter):
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "websocket":
             return
-        app = self.build_middleware_stack(scope, receive, send)
-        app = WebSocketErrorMiddleware(app)
+        # Compose the middleware chain once per configuration change rather
+        # than on every connection.
+        app = self._composed_app
+        if app is None:
+            app = self.build_middleware_stack(scope, receive, send)
+            app = self._composed_app = WebSocketErrorMiddleware(app)
         await app(scope, receive, send)
 
     async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
         url = get_route_path(scope)
-        for mount_path, sub_app in self.sub_routers.items():
+        # Longest prefix wins deterministically, and the sorted view is
+        # rebuilt only when a router is mounted.
+        mounts = self._mounts_by_length
+        if mounts is None:
+            mounts = self._mounts_by_length = tuple(
+                sorted(
+                    self.sub_routers.items(),
+                    key=lambda item: len(item[0]),
+                    reverse=True,
+                )
+            )
+        for mount_path, sub_app in mounts:
             if url.startswith(mount_path):
                 scope["path"] = url[len(mount_path) :]
                 await sub_app(scope, receive, send)
@@ -233,6 +259,7 @@ class WSRouter(BaseRouter):
 
         """
         self.app = middleware_cls(self.app)
+        self._composed_app = None
 
     def mount_router(  # type:ignore
         self, app: "WSRouter", path: typing.Optional[str] = None
@@ -251,11 +278,13 @@ class WSRouter(BaseRouter):
 
         if path == "":
             self.sub_routers[path] = app
+            self._mounts_by_length = None
             return
         if not path.startswith("/"):
             path = f"/{path}"
 
         self.sub_routers[path] = app
+        self._mounts_by_length = None
 
     def __repr__(self) -> str:
         return f"<WSRouter prefix='{self.prefix}' routes={len(self.routes)}>"
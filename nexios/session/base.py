@@ -6,6 +6,10 @@ from typing import Any, Dict, Iterable, Union
 
 from nexios.config import MakeConfig, get_config
 
+# warnings.warn walks the caller stack; only pay for it once, not on every
+# session instantiation.
+_warned_missing_secret = False
+
 
 class BaseSessionInterface:
     modified = False
@@ -17,10 +21,13 @@ class BaseSessionInterface:
         config = get_config()
         self.session_key = session_key
         if not config.secret_key:
-            warnings.warn(
-                "`secret_key` is not set, `secret_key`  is required to use session",
-                RuntimeWarning,
-            )
+            global _warned_missing_secret
+            if not _warned_missing_secret:
+                _warned_missing_secret = True
+                warnings.warn(
+                    "`secret_key` is not set, `secret_key`  is required to use session",
+                    RuntimeWarning,
+                )
             return
         self.config = config
         self.session_config: MakeConfig = config.session
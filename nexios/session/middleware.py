@@ -9,33 +9,43 @@ from .signed_cookies import SignedSessionManager
 
 
 class SessionMiddleware(BaseMiddleware):
+    _resolved = False
+
     def get_manager(self):
         if not self.config:
             return SignedSessionManager
         else:
             return self.config.manager or SignedSessionManager
 
+    def _resolve(self) -> None:
+        """Read the session configuration once and cache it on the instance."""
+        config = get_config()
+        self.secret = config.secret_key
+        self.config = config.session
+        if self.config:
+            self.session_cookie_name = (
+                self.config.session_cookie_name or "session_id"
+            )
+        else:
+            self.session_cookie_name = "session_id"
+        self._manager = self.get_manager()
+        self._resolved = True
+
     async def process_request(
         self,
         request: Request,
         response: Response,
         call_next: typing.Callable[..., typing.Awaitable[typing.Any]],
     ):
-        self.secret = get_config().secret_key
-        self.config = get_config().session
+        if not self._resolved:
+            self._resolve()
         if not self.secret:
             return await call_next()
 
-        if self.config:
-            session_cookie_name = self.config.session_cookie_name or "session_id"
-        else:
-            session_cookie_name = "session_id"
-
-        self.session_cookie_name = session_cookie_name
-        manager = self.get_manager()
+        manager = self._manager
         request.scope["session"] = manager
         session: type[BaseSessionInterface] = manager(
-            session_key=request.cookies.get(session_cookie_name)  # type:ignore
+            session_key=request.cookies.get(self.session_cookie_name)  # type:ignore
         )
         await session.load()  # type: ignore
         request.scope["session"] = session
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import io
+import os
 import typing
 from typing import Any, Dict, ItemsView, Iterator, KeysView, Sequence, ValuesView
 from urllib.parse import SplitResult, parse_qsl, urlencode, urlsplit
+from nexios.utils import bufferpool
 from nexios.utils.concurrency import run_in_threadpool
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover
+    blake3 = None  # type: ignore[assignment]
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None  # type: ignore[assignment]
 from pydantic import GetJsonSchemaHandler,GetCoreSchemaHandler
 import pydantic
 from pydantic_core import core_schema
@@ -725,10 +740,27 @@ class UploadedFile:
 
     @property
     def _in_memory(self) -> bool:
+        if isinstance(self.file, io.BytesIO):
+            return True
         # check for SpooledTemporaryFile._rolled
         rolled_to_disk = getattr(self.file, "_rolled", True)
         return not rolled_to_disk
 
+    def _memory_buffer(self) -> typing.Optional[memoryview]:
+        """
+        Zero-copy view of the contents when backed by an in-memory buffer.
+
+        Returns ``None`` for disk-backed files; callers must fall back to
+        regular reads in that case.
+        """
+        if isinstance(self.file, io.BytesIO):
+            return self.file.getbuffer()
+        if self._in_memory:
+            inner = getattr(self.file, "_file", None)
+            if isinstance(inner, io.BytesIO):
+                return inner.getbuffer()
+        return None
+
     async def write(self, data: bytes) -> None:
         if self.size is not None:
             self.size += len(data)
@@ -743,6 +775,36 @@ class UploadedFile:
             return self.file.read(size)
         return await run_in_threadpool(self.file.read, size)
 
+    async def chunks(self, chunk_size: int = 65536) -> typing.AsyncIterator[bytes]:
+        """
+        Iterate over the file contents in ``chunk_size`` blocks.
+
+        A single scratch buffer is borrowed from the shared buffer pool
+        and filled via ``readinto``, so no per-chunk read allocation is
+        made regardless of file size.
+        """
+        body = self._memory_buffer()
+        if body is not None:
+            with body:
+                for start in range(0, len(body), chunk_size):
+                    yield bytes(body[start : start + chunk_size])
+            return
+        buf = bufferpool.acquire(chunk_size)
+        view = memoryview(buf)[:chunk_size]
+        try:
+            await self.seek(0)
+            while True:
+                if self._in_memory:
+                    read = self.file.readinto(view)
+                else:
+                    read = await run_in_threadpool(self.file.readinto, view)
+                if not read:
+                    break
+                yield bytes(view[:read])
+        finally:
+            view.release()
+            bufferpool.release(buf)
+
     async def seek(self, offset: int) -> None:
         if self._in_memory:
             self.file.seek(offset)
@@ -755,6 +817,118 @@ class UploadedFile:
         else:
             await run_in_threadpool(self.file.close)
 
+    def _sync_save(self, path: typing.Union[str, "os.PathLike[str]"]) -> None:
+        if not self._in_memory:
+            try:
+                src_fd = self.file.fileno()
+            except (OSError, ValueError):
+                src_fd = None
+            if src_fd is not None and hasattr(os, "sendfile"):
+                # Push anything still sitting in the Python-level buffer to
+                # the OS; sendfile reads the raw descriptor and would
+                # silently miss unflushed bytes.
+                self.file.flush()
+                size = self.size or os.fstat(src_fd).st_size
+                out_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(out_fd, src_fd, offset, size - offset)
+                        if sent == 0:
+                            raise OSError(
+                                f"sendfile copied {offset} of {size} bytes"
+                            )
+                        offset += sent
+                    return
+                except OSError:
+                    # Filesystem without sendfile support; fall back to the
+                    # userspace copy loop below.
+                    if offset:
+                        raise
+                finally:
+                    os.close(out_fd)
+        self.file.seek(0)
+        with open(path, "wb") as out:
+            while chunk := self.file.read(1 << 16):
+                out.write(chunk)
+        self.file.seek(0)
+
+    async def save(self, path: typing.Union[str, "os.PathLike[str]"]) -> None:
+        """
+        Persist the file contents to ``path``.
+
+        Disk-backed files are copied kernel-side via ``os.sendfile`` so the
+        data never round-trips through userspace; in-memory bodies are
+        written out with a plain chunked copy.
+        """
+        await run_in_threadpool(self._sync_save, path)
+
+    def _sync_hash_stream(self, algorithm: str) -> str:
+        self.file.seek(0)
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            # file_digest keeps the read/update loop in C and releases the
+            # GIL around each block.
+            hasher = hashlib.file_digest(self.file, algorithm)
+        else:
+            hasher = hashlib.new(algorithm)
+            while chunk := self.file.read(1 << 16):
+                hasher.update(chunk)
+        self.file.seek(0)
+        return hasher.hexdigest()
+
+    def _sync_fast_hash(self, hasher: typing.Any) -> str:
+        self.file.seek(0)
+        while chunk := self.file.read(1 << 20):
+            hasher.update(chunk)
+        self.file.seek(0)
+        return hasher.hexdigest()
+
+    async def fast_hash(self, algorithm: str = "blake3") -> str:
+        """
+        Compute a fast non-cryptographic digest of the file contents.
+
+        Intended for dedup/ETag use-cases where collision resistance does
+        not need to be cryptographic; use :meth:`calculate_hash` for
+        security-sensitive callers. Requires the optional ``blake3`` or
+        ``xxhash`` package depending on the algorithm.
+        """
+        if algorithm == "blake3":
+            if blake3 is None:
+                raise ImportError("blake3 is not installed.")
+            hasher = blake3.blake3()
+        elif algorithm in ("xxh3", "xxh3_64"):
+            if xxhash is None:
+                raise ImportError("xxhash is not installed.")
+            hasher = xxhash.xxh3_64()
+        else:
+            raise ValueError(f"Unsupported fast-hash algorithm: {algorithm!r}")
+        body = self._memory_buffer()
+        if body is not None:
+            with body:
+                hasher.update(body)
+            return hasher.hexdigest()
+        return await run_in_threadpool(self._sync_fast_hash, hasher)
+
+    async def calculate_hash(self, algorithm: str = "sha256") -> str:
+        """
+        Compute a hex digest of the file contents.
+
+        The file is hashed incrementally in 64 KB chunks so large uploads are
+        never materialized in memory, and the whole loop runs as a single
+        threadpool call for disk-backed files.
+        """
+        body = self._memory_buffer()
+        if body is not None:
+            with body:
+                hasher = hashlib.new(algorithm)
+                hasher.update(body)
+            return hasher.hexdigest()
+        # For small files the threadpool round trip costs more than the
+        # hash itself, so stay on the event loop.
+        if self.size is not None and self.size < 262144:
+            return self._sync_hash_stream(algorithm)
+        return await run_in_threadpool(self._sync_hash_stream, algorithm)
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}("
@@ -788,6 +962,22 @@ class UploadedFile:
 
     
 
+async def save_uploaded_files(
+    files: Sequence[UploadedFile],
+    paths: Sequence[typing.Union[str, "os.PathLike[str]"]],
+) -> None:
+    """
+    Persist several uploaded files concurrently.
+
+    Each save runs as its own threadpool job and all of them are awaited
+    together, so multi-file form submissions overlap their disk writes
+    instead of serializing one file at a time.
+    """
+    if len(files) != len(paths):
+        raise ValueError("files and paths must have the same length")
+    await asyncio.gather(*(f.save(p) for f, p in zip(files, paths)))
+
+
 class FormData(
     MultiDict[str, typing.Union[UploadedFile, str, Sequence[Any]]]  # type:ignore
 ):  # type:ignore
@@ -161,6 +161,14 @@ class Client(httpx.AsyncClient):
             extensions=extensions,
         )
 
+    def reset_cookies(self) -> None:
+        """Clear cookies collected by previous requests.
+
+        Lets one long-lived client be reused across tests without
+        re-entering the async context per test.
+        """
+        self.cookies.clear()
+
     async def __aenter__(self) -> "Client":
         await super().__aenter__()
         return self
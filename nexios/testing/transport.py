@@ -1,6 +1,8 @@
-import io
+import asyncio
+import contextlib
+from collections import deque
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 from urllib.parse import unquote
 
 import anyio
@@ -10,6 +12,8 @@ ASGIScope = Dict[str, Any]
 Message = Dict[str, Any]
 HeaderList = List[Tuple[bytes, bytes]]
 
+_DEFAULT_PORTS = {"http": 80, "https": 443, "ws": 80, "wss": 443}
+
 
 class WebSocketState(Enum):
     CONNECTING = 0
@@ -34,6 +38,18 @@ class WebSocketConnection:
         raise_app_exceptions: bool = True,
         timeout: float = 5.0,
     ):
+        # Set by the transport when this instance participates in pooling.
+        self._pool: Optional[deque] = None
+        self.reset(app, scope, raise_app_exceptions, timeout)
+
+    def reset(
+        self,
+        app: Any,
+        scope: ASGIScope,
+        raise_app_exceptions: bool = True,
+        timeout: float = 5.0,
+    ) -> None:
+        """(Re)initialize connection state so pooled instances start fresh."""
         self.app = app
         self.scope = scope
         self.raise_app_exceptions = raise_app_exceptions
@@ -45,20 +61,21 @@ class WebSocketConnection:
         self.close_reason: Optional[str] = None
         self.subprotocol: Optional[str] = None
 
-        # Communication channels
-        self.receive_channel, self.send_channel = anyio.create_memory_object_stream(
-            max_buffer_size=float("inf")
-        )
-        self.app_channel, self.client_channel = anyio.create_memory_object_stream(
-            max_buffer_size=float("inf")
-        )
+        # Message queues: plain deques with an event per direction are far
+        # cheaper than memory object streams (no lock acquire/release per
+        # message) and, unlike ``async with stream:``, nothing gets closed
+        # behind our back after a single send.
+        self._app_queue: deque = deque()
+        self._client_queue: deque = deque()
+        self._app_event = asyncio.Event()
+        self._client_event = asyncio.Event()
 
         # Control events
         self.connection_event = anyio.Event()
         self.disconnection_event = anyio.Event()
 
-        # Background task group
-        self.task_group = None
+        # Background application task
+        self.app_task: Optional[asyncio.Task] = None
 
     async def run_app(self) -> None:
         """Run the ASGI application to handle the WebSocket connection."""
@@ -94,13 +111,10 @@ class WebSocketConnection:
             return {"type": "websocket.disconnect", "code": self.close_code}
 
         try:
-            async with anyio.move_on_after(self.timeout) as scope:
-                async with self.app_channel as receiver:
-                    message = await receiver.receive()
-                if scope.cancel_called:
-                    await self._handle_disconnect(1002, "Receive timeout")
-                    return {"type": "websocket.disconnect", "code": 1002}
-                return message
+            return await self._pop(self._app_queue, self._app_event)
+        except asyncio.TimeoutError:
+            await self._handle_disconnect(1002, "Receive timeout")
+            return {"type": "websocket.disconnect", "code": 1002}
         except Exception:
             await self._handle_disconnect(1006, "Connection lost")
             return {"type": "websocket.disconnect", "code": 1006}
@@ -112,27 +126,29 @@ class WebSocketConnection:
         try:
             if message_type == "websocket.accept":
                 self.subprotocol = message.get("subprotocol")
-                async with self.client_channel as sender:
-                    await sender.send({"type": "accept"})
+                self._client_queue.append({"type": "accept"})
+                self._client_event.set()
                 self.connection_event.set()
 
             elif message_type == "websocket.send":
-                async with self.client_channel as sender:
-                    await sender.send(
-                        {
-                            "type": "message",
-                            "data": message.get("text") or message.get("bytes"),
-                            "is_text": "text" in message,
-                        }
-                    )
+                self._client_queue.append(
+                    {
+                        "type": "message",
+                        "data": message.get("text") or message.get("bytes"),
+                        "is_text": "text" in message,
+                    }
+                )
+                self._client_event.set()
 
             elif message_type == "websocket.close":
                 code = message.get("code", 1000)
                 reason = message.get("reason")
 
                 # First notify the client
-                async with self.client_channel as sender:
-                    await sender.send({"type": "close", "code": code, "reason": reason})
+                self._client_queue.append(
+                    {"type": "close", "code": code, "reason": reason}
+                )
+                self._client_event.set()
 
                 # Then handle the disconnect
                 await self._handle_disconnect(code, reason)
@@ -153,32 +169,29 @@ class WebSocketConnection:
         # Set the disconnection event first
         self.disconnection_event.set()
 
-        # Then try to clean up the task group
-        if self.task_group and self.task_group.cancel_scope:
-            await self.task_group.cancel_scope.cancel()
+        # Then cancel the app task. Task.cancel() is synchronous; awaiting
+        # the task afterwards lets it actually unwind. Skip the await when
+        # the disconnect is raised from inside the app task itself.
+        task = self.app_task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
 
     async def connect(self) -> None:
         """Establish the WebSocket connection."""
         if self.state != WebSocketState.CONNECTING:
             raise RuntimeError("WebSocket is already connected or disconnected")
 
-        async with anyio.create_task_group() as tg:
-            self.task_group = tg
-            await tg.start(self.run_app)
-
-            timeout_error = False
-            try:
-                async with anyio.move_on_after(self.timeout) as scope:
-                    await self.connection_event.wait()
-                    timeout_error = scope.cancel_called
-
-                if timeout_error:
-                    await self._handle_disconnect(1006, "Connection timeout")
-                    raise RuntimeError("WebSocket connection timed out")
-
-            except Exception as e:
-                await self._handle_disconnect(1006, str(e))
-                raise
+        self.app_task = asyncio.create_task(self.run_app())
+        try:
+            await asyncio.wait_for(self.connection_event.wait(), self.timeout)
+        except asyncio.TimeoutError:
+            await self._handle_disconnect(1006, "Connection timeout")
+            raise RuntimeError("WebSocket connection timed out")
+        except Exception as e:
+            await self._handle_disconnect(1006, str(e))
+            raise
 
     async def send(self, data: Union[str, bytes]) -> None:
         """Send data through the WebSocket."""
@@ -194,19 +207,20 @@ class WebSocketConnection:
             "bytes": data if isinstance(data, bytes) else None,
         }
 
-        try:
-            timeout_error = False
-            async with anyio.move_on_after(self.timeout) as scope:
-                async with self.receive_channel as sender:
-                    await sender.send(message)
-                timeout_error = scope.cancel_called
+        # Appending to a deque cannot block, so no timeout is needed here.
+        self._app_queue.append(message)
+        self._app_event.set()
 
-            if timeout_error:
-                await self._handle_disconnect(1002, "Protocol error")
-                raise WebSocketDisconnect(1002, "Send timeout")
-        except Exception:
-            await self._handle_disconnect(1002, "Protocol error")
-            raise WebSocketDisconnect(1002, "Send error")
+    async def _pop(self, queue: deque, event: asyncio.Event) -> Message:
+        """Pop the next queued message, arming a timer only when blocking.
+
+        The non-empty fast path costs no timeout machinery at all; a timer
+        handle is allocated per *blocked* wait rather than per message.
+        """
+        while not queue:
+            event.clear()
+            await asyncio.wait_for(event.wait(), self.timeout)
+        return queue.popleft()
 
     async def receive(self) -> Union[str, bytes]:
         """Receive data from the WebSocket."""
@@ -216,15 +230,9 @@ class WebSocketConnection:
             )
 
         try:
-            timeout_error = False
-            message = None
-
-            async with anyio.move_on_after(self.timeout) as scope:
-                async with self.client_channel as receiver:
-                    message = await receiver.receive()
-                timeout_error = scope.cancel_called
-
-            if timeout_error or message is None:
+            try:
+                message = await self._pop(self._client_queue, self._client_event)
+            except asyncio.TimeoutError:
                 await self._handle_disconnect(1002, "Protocol error")
                 raise WebSocketDisconnect(1002, "Receive timeout")
 
@@ -251,11 +259,20 @@ class WebSocketConnection:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
+        # Only recycle cleanly closed connections; an exception may leave
+        # queues or state mid-flight.
+        if exc_type is None and self._pool is not None:
+            self._pool.append(self)
 
 
 class NexiosAsyncTransport(httpx.AsyncBaseTransport):
     """Custom ASGI transport with full HTTP and WebSocket support."""
 
+    # Cleanly closed WebSocketConnection instances are recycled here to
+    # amortize per-connection setup across test suites that open many
+    # sockets.
+    _ws_pool: ClassVar[deque] = deque(maxlen=64)
+
     def __init__(
         self,
         app: Any,
@@ -272,6 +289,11 @@ class NexiosAsyncTransport(httpx.AsyncBaseTransport):
         self.app_state = app_state or {}
         self.websocket_timeout = websocket_timeout
 
+    def _new_scope_state(self) -> Dict[str, Any]:
+        # request.state writes through to scope["state"], so every request
+        # needs its own dict; only pay for a copy when there is seed state.
+        return dict(self.app_state) if self.app_state else {}
+
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
         """Handle the incoming request and route it appropriately."""
         scheme, netloc, path, raw_path, query = self._parse_url(request)
@@ -292,7 +314,7 @@ class NexiosAsyncTransport(httpx.AsyncBaseTransport):
         scheme: str,
         path: str,
         raw_path: bytes,
-        query: str,
+        query: bytes,
         headers: HeaderList,
         host: str,
         port: int,
@@ -325,13 +347,23 @@ class NexiosAsyncTransport(httpx.AsyncBaseTransport):
             request, scheme, path, raw_path, query, headers, host, port
         )
 
-        # Create WebSocket connection handler
-        websocket = WebSocketConnection(
-            app=self.app,
-            scope=scope,
-            raise_app_exceptions=self.raise_app_exceptions,
-            timeout=self.websocket_timeout,
-        )
+        # Create (or recycle) the WebSocket connection handler
+        if self._ws_pool:
+            websocket = self._ws_pool.popleft()
+            websocket.reset(
+                app=self.app,
+                scope=scope,
+                raise_app_exceptions=self.raise_app_exceptions,
+                timeout=self.websocket_timeout,
+            )
+        else:
+            websocket = WebSocketConnection(
+                app=self.app,
+                scope=scope,
+                raise_app_exceptions=self.raise_app_exceptions,
+                timeout=self.websocket_timeout,
+            )
+            websocket._pool = self._ws_pool
 
         # Return a 101 Switching Protocols response with proper WebSocket headers
         response_headers = {
@@ -359,7 +391,7 @@ class NexiosAsyncTransport(httpx.AsyncBaseTransport):
         scheme: str,
         path: str,
         raw_path: bytes,
-        query: str,
+        query: bytes,
         headers: HeaderList,
         host: str,
         port: int,
@@ -377,8 +409,11 @@ class NexiosAsyncTransport(httpx.AsyncBaseTransport):
         request_complete = False
         response_started = False
         response_complete = anyio.Event()
-        response_body = io.BytesIO()
-        response_headers: List[Tuple[str, str]] = []
+        # Collect raw chunks and join once: a single-chunk response is handed
+        # to httpx without copying, and multi-chunk bodies pay one memcpy
+        # instead of amortized BytesIO growth.
+        response_chunks: List[bytes] = []
+        response_headers: HeaderList = []
         status_code = 500
 
         async def receive() -> Message:
@@ -395,15 +430,16 @@ class NexiosAsyncTransport(httpx.AsyncBaseTransport):
             nonlocal response_started, status_code, response_headers
             if message["type"] == "http.response.start":
                 status_code = message["status"]
-                response_headers = [
-                    (k.decode(), v.decode()) for k, v in message.get("headers", [])
-                ]
+                # httpx accepts raw bytes header pairs; no need to decode
+                # and re-encode every header per response.
+                response_headers = message.get("headers", [])
                 response_started = True
             elif message["type"] == "http.response.body":
                 assert response_started, "Received body before response start"
-                response_body.write(message.get("body", b""))
+                body = message.get("body", b"")
+                if body:
+                    response_chunks.append(body)
                 if not message.get("more_body", False):
-                    response_body.seek(0)
                     response_complete.set()
 
         try:
@@ -412,49 +448,49 @@ class NexiosAsyncTransport(httpx.AsyncBaseTransport):
             if self.raise_app_exceptions:
                 raise exc
             status_code = 500
-            response_body = io.BytesIO(b"Internal Server Error")
+            response_chunks = [b"Internal Server Error"]
 
         if self.raise_app_exceptions and not response_started:
             raise RuntimeError("TestClient did not receive any response.")
 
         return httpx.Response(
             status_code,
-            headers=dict(response_headers),
-            content=response_body.read(),
+            headers=response_headers,
+            content=b"".join(response_chunks),
             request=request,
         )
 
     # Helper methods remain the same as previous implementation
-    def _parse_url(self, request: httpx.Request) -> Tuple[str, str, str, bytes, str]:
+    def _parse_url(self, request: httpx.Request) -> Tuple[str, str, str, bytes, bytes]:
+        # Strip the query tail here once and keep the query as bytes; the
+        # scope builders then use both values without re-splitting or
+        # round-tripping through str.
+        url = request.url
         return (
-            request.url.scheme,
-            request.url.netloc.decode("ascii"),
-            request.url.path,
-            request.url.raw_path,
-            request.url.query.decode("ascii"),
+            url.scheme,
+            url.netloc.decode("ascii"),
+            url.path,
+            url.raw_path.split(b"?", 1)[0],
+            url.query,
         )
 
     def _get_host_port(self, netloc: str, scheme: str) -> Tuple[str, int]:
-        default_ports = {"http": 80, "https": 443, "ws": 80, "wss": 443}
         if ":" in netloc:
             host, port = netloc.split(":", 1)
             return host, int(port)
-        return netloc, default_ports.get(scheme, 80)
+        return netloc, _DEFAULT_PORTS.get(scheme, 80)
 
     def _prepare_headers(
         self, request: httpx.Request, host: str, port: int
     ) -> HeaderList:
-        headers = (
-            [(b"host", f"{host}:{port}".encode())]
+        headers: HeaderList = (
+            [(b"host", f"{host}:{port}".encode("ascii"))]
             if "host" not in request.headers
             else []
         )
-        headers.extend(
-            [
-                (key.lower().encode(), value.encode())
-                for key, value in request.headers.multi_items()
-            ]
-        )
+        # httpx already stores headers as encoded byte pairs; only the keys
+        # need lower-casing for the ASGI scope.
+        headers.extend((key.lower(), value) for key, value in request.headers.raw)
         return headers
 
     def _build_http_scope(
@@ -463,7 +499,7 @@ class NexiosAsyncTransport(httpx.AsyncBaseTransport):
         scheme: str,
         path: str,
         raw_path: bytes,
-        query: str,
+        query: bytes,
         headers: HeaderList,
         host: str,
         port: int,
@@ -473,14 +509,14 @@ class NexiosAsyncTransport(httpx.AsyncBaseTransport):
             "http_version": "1.1",
             "method": request.method,
             "path": unquote(path),
-            "raw_path": raw_path.split(b"?", 1)[0],
+            "raw_path": raw_path,
             "root_path": self.root_path,
             "scheme": scheme,
-            "query_string": query.encode(),
+            "query_string": query,
             "headers": headers,
             "client": self.client,
             "server": [host, port],
-            "state": self.app_state.copy(),
+            "state": self._new_scope_state(),
         }
 
     def _build_websocket_scope(
@@ -489,28 +525,31 @@ class NexiosAsyncTransport(httpx.AsyncBaseTransport):
         scheme: str,
         path: str,
         raw_path: bytes,
-        query: str,
+        query: bytes,
         headers: HeaderList,
         host: str,
         port: int,
     ) -> ASGIScope:
         subprotocols = []
-        if "sec-websocket-protocol" in request.headers:
-            subprotocols = [
-                p.strip() for p in request.headers["sec-websocket-protocol"].split(",")
-            ]
+        protocol_header = request.headers.get("sec-websocket-protocol")
+        if protocol_header:
+            # Single-protocol requests are the norm; skip the split for them.
+            if "," not in protocol_header:
+                subprotocols = [protocol_header.strip()]
+            else:
+                subprotocols = [p.strip() for p in protocol_header.split(",")]
 
         return {
             "type": "websocket",
             "path": unquote(path),
-            "raw_path": raw_path.split(b"?", 1)[0],
+            "raw_path": raw_path,
             "root_path": self.root_path,
             "scheme": scheme,
-            "query_string": query.encode(),
+            "query_string": query,
             "headers": headers,
             "client": self.client,
             "server": [host, port],
             "subprotocols": subprotocols,
-            "state": self.app_state.copy(),
+            "state": self._new_scope_state(),
             "app": self.app,  # Include app in scope
         }
@@ -39,6 +39,18 @@ def is_async_callable(obj: typing.Any) -> typing.Any:
     )  # type:ignore
 
 
+@functools.lru_cache(maxsize=None)
+def cached_iscoroutinefunction(obj: typing.Callable[..., typing.Any]) -> bool:
+    """
+    Memoized ``asyncio.iscoroutinefunction`` for long-lived callables.
+
+    The reflection walks ``__wrapped__`` chains on every call; handlers and
+    backend methods never change coroutine-ness, so the answer is cached per
+    callable.
+    """
+    return asyncio.iscoroutinefunction(obj)
+
+
 T_co = typing.TypeVar("T_co", covariant=True)
 
 
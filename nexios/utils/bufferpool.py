@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import typing
+from collections import deque
+
+# Bucket sizes chosen to cover small form fields (4 KB), streaming chunk
+# reads (64 KB) and large upload bodies (1 MB).
+_BUCKET_SIZES: typing.Tuple[int, ...] = (4096, 65536, 1 << 20)
+_POOL_DEPTH = 32
+
+_lock = threading.Lock()
+_pools: typing.Dict[int, typing.Deque[bytearray]] = {
+    size: deque(maxlen=_POOL_DEPTH) for size in _BUCKET_SIZES
+}
+_pooled_ids: typing.Set[int] = set()
+
+
+def _bucket_for(size: int) -> typing.Optional[int]:
+    for bucket in _BUCKET_SIZES:
+        if size <= bucket:
+            return bucket
+    return None
+
+
+def acquire(size: int) -> bytearray:
+    """
+    Acquire a ``bytearray`` of at least ``size`` bytes.
+
+    Buffers come from a size-bucketed pool when available; oversized
+    requests fall through to a plain allocation and are never pooled.
+    """
+    bucket = _bucket_for(size)
+    if bucket is None:
+        return bytearray(size)
+    with _lock:
+        pool = _pools[bucket]
+        if pool:
+            buf = pool.popleft()
+            _pooled_ids.discard(id(buf))
+            return buf
+    return bytearray(bucket)
+
+
+def release(buf: bytearray) -> None:
+    """
+    Return a buffer previously obtained from :func:`acquire` to the pool.
+
+    Double releases and buffers that do not match a bucket size are
+    ignored, so callers may release unconditionally in cleanup paths.
+    """
+    size = len(buf)
+    if size not in _BUCKET_SIZES:
+        return
+    with _lock:
+        if id(buf) in _pooled_ids:
+            return
+        pool = _pools[size]
+        if len(pool) < _POOL_DEPTH:
+            _pooled_ids.add(id(buf))
+            pool.append(buf)
@@ -1,8 +1,15 @@
+import asyncio
+import json
 import os
-import sys
 import time
 import typing
 import uuid
+from collections import deque
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 from nexios import logging as nexios_logger
 from nexios.websockets import WebSocket
@@ -17,8 +24,26 @@ from .utils import (
 
 logging = nexios_logger.getLogger("nexios")
 
+_PAYLOAD_TYPES = frozenset(member.value for member in PayloadTypeEnum)
+
+
+def _payload_size(payload: typing.Any) -> int:
+    """Approximate wire size of a payload in bytes for history accounting."""
+    if isinstance(payload, (bytes, bytearray)):
+        return len(payload)
+    if isinstance(payload, str):
+        return len(payload.encode())
+    try:
+        return len(json.dumps(payload, separators=(",", ":"), ensure_ascii=False))
+    except (TypeError, ValueError):
+        return 0
+
 
 class Channel:
+    # Fanout iterates large channel sets; slots keep instances small and
+    # make the per-message attribute loads fixed-offset reads.
+    __slots__ = ("websocket", "expires", "payload_type", "uuid", "created", "_send_fn")
+
     def __init__(
         self,
         websocket: WebSocket,
@@ -34,36 +59,48 @@ class Channel:
             uuid (str): channel uuid
             created (tim): channel creation time
         """
-        assert isinstance(websocket, WebSocket)
-        assert isinstance(expires, int)
-        assert isinstance(payload_type, str) and payload_type in [
-            PayloadTypeEnum.JSON.value,
-            PayloadTypeEnum.TEXT.value,
-            PayloadTypeEnum.BYTES.value,
-        ]
+        if payload_type not in _PAYLOAD_TYPES:
+            raise ValueError(
+                f"payload_type must be one of {sorted(_PAYLOAD_TYPES)}, "
+                f"got {payload_type!r}"
+            )
 
         self.websocket = websocket
         self.expires = expires
         self.payload_type = payload_type
         self.uuid = uuid.uuid4()
         self.created = time.time()
+        # Resolve the send method once; _send then avoids re-comparing
+        # payload_type on every message. JSON channels serialize through
+        # orjson when it is installed.
+        if payload_type == PayloadTypeEnum.JSON.value and orjson is not None:
+            self._send_fn: typing.Callable[[typing.Any], typing.Awaitable[None]] = (
+                self._send_json_fast
+            )
+        else:
+            self._send_fn = {
+                PayloadTypeEnum.JSON.value: websocket.send_json,
+                PayloadTypeEnum.TEXT.value: websocket.send_text,
+                PayloadTypeEnum.BYTES.value: websocket.send_bytes,
+            }[payload_type]
 
     async def _send(self, payload: typing.Any) -> None:
         try:
-            if self.payload_type == "json":
-                await self.websocket.send_json(payload)
-            elif self.payload_type == "text":
-                await self.websocket.send_text(payload)
-            elif self.payload_type == "bytes":
-                await self.websocket.send_bytes(payload)
-            else:
-                await self.websocket.send(payload)
+            await self._send_fn(payload)
         except RuntimeError as error:
             logging.debug(error)
 
-        self.created = time.time()
+    async def _send_json_fast(self, payload: typing.Any) -> None:
+        await self.websocket.send_text(orjson.dumps(payload).decode())
+
+    async def _send_prepared(self, text: str) -> None:
+        """Send an already-serialized JSON payload without re-dumping it."""
+        try:
+            await self.websocket.send_text(text)
+        except RuntimeError as error:
+            logging.debug(error)
 
-    async def _is_expired(self) -> bool:
+    def _is_expired(self) -> bool:
         if not self.expires:
             return False
         return (self.expires + int(self.created)) < time.time()
@@ -74,9 +111,12 @@ class Channel:
 
 class ChannelBox:
     CHANNEL_GROUPS: typing.Dict[
-        str, typing.Any
-    ] = {}  # groups of channels ~ key: group_name, val: dict of channels
-    CHANNEL_GROUPS_HISTORY: typing.Dict[str, typing.Any] = {}  # history messages
+        str, typing.Set[Channel]
+    ] = {}  # groups of channels ~ key: group_name, val: set of channels
+    CHANNEL_GROUPS_HISTORY: typing.Dict[str, typing.Deque[ChannelMessageDC]] = (
+        {}
+    )  # history messages
+    CHANNEL_GROUPS_HISTORY_BYTES: typing.Dict[str, int] = {}  # payload bytes per group
     HISTORY_SIZE: int = int(os.getenv("CHANNEL_BOX_HISTORY_SIZE", 1_048_576))
 
     @classmethod
@@ -95,12 +135,12 @@ class ChannelBox:
         assert group_name, "Group name must to be set."
 
         if group_name not in cls.CHANNEL_GROUPS:
-            cls.CHANNEL_GROUPS[group_name] = {}
+            cls.CHANNEL_GROUPS[group_name] = set()
             channel_add_status = ChannelAddStatusEnum.CHANNEL_ADDED
         else:
             channel_add_status = ChannelAddStatusEnum.CHANNEL_EXIST
 
-        cls.CHANNEL_GROUPS[group_name][channel] = ...
+        cls.CHANNEL_GROUPS[group_name].add(channel)
         return channel_add_status
 
     @classmethod
@@ -115,22 +155,21 @@ class ChannelBox:
             channel (Channel): Instance of Channel class
             group_name (str): Group name
         """
-        channel_remove_status: typing.Any = None
-        if channel in cls.CHANNEL_GROUPS.get(group_name, {}):
-            try:
-                del cls.CHANNEL_GROUPS[group_name][channel]
-                channel_remove_status = ChannelRemoveStatusEnum.CHANNEL_REMOVED
-            except KeyError:
-                channel_remove_status = ChannelRemoveStatusEnum.CHANNEL_DOES_NOT_EXIST
-
-        if not any(cls.CHANNEL_GROUPS.get(group_name, {})):
-            try:
-                del cls.CHANNEL_GROUPS[group_name]
-                channel_remove_status = ChannelRemoveStatusEnum.GROUP_REMOVED
-            except KeyError:
-                channel_remove_status = ChannelRemoveStatusEnum.GROUP_DOES_NOT_EXIST
-
-        await cls._clean_expired()
+        # One dict lookup instead of four hash probes on the same key.
+        group = cls.CHANNEL_GROUPS.get(group_name)
+        if group is None:
+            return ChannelRemoveStatusEnum.GROUP_DOES_NOT_EXIST
+
+        if channel in group:
+            group.discard(channel)
+            channel_remove_status = ChannelRemoveStatusEnum.CHANNEL_REMOVED
+        else:
+            channel_remove_status = ChannelRemoveStatusEnum.CHANNEL_DOES_NOT_EXIST
+
+        if not group:
+            cls.CHANNEL_GROUPS.pop(group_name, None)
+            channel_remove_status = ChannelRemoveStatusEnum.GROUP_REMOVED
+
         return channel_remove_status
 
     @classmethod
@@ -151,21 +190,49 @@ class ChannelBox:
         assert group_name, "Group name must to be set."
 
         if save_history:
-            cls.CHANNEL_GROUPS_HISTORY.setdefault(group_name, [])
-            cls.CHANNEL_GROUPS_HISTORY[group_name].append(
+            # sys.getsizeof on a list only measures the list header, so the
+            # old guard never tracked payload memory. Keep an incremental
+            # byte counter per group and trim from the front when over budget.
+            history = cls.CHANNEL_GROUPS_HISTORY.setdefault(group_name, deque())
+            history.append(
                 ChannelMessageDC(
                     payload=payload,  # type:ignore
                 )
             )
-            if sys.getsizeof(cls.CHANNEL_GROUPS_HISTORY[group_name]) > cls.HISTORY_SIZE:
-                cls.CHANNEL_GROUPS_HISTORY[group_name] = []
-
-        group_send_status = GroupSendStatusEnum.NO_SUCH_GROUP
-        for channel in cls.CHANNEL_GROUPS.get(group_name, {}):
-            await channel._send(payload)
-            group_send_status = GroupSendStatusEnum.GROUP_SEND
-
-        return group_send_status
+            used = cls.CHANNEL_GROUPS_HISTORY_BYTES.get(group_name, 0)
+            used += _payload_size(payload)
+            while used > cls.HISTORY_SIZE and history:
+                dropped = history.popleft()
+                used -= _payload_size(dropped.payload)
+            cls.CHANNEL_GROUPS_HISTORY_BYTES[group_name] = used
+
+        # Snapshot the membership so concurrent joins/leaves cannot mutate
+        # the set mid-fanout, dropping expired channels lazily as we go
+        # instead of sweeping every group on each unsubscribe.
+        group = cls.CHANNEL_GROUPS.get(group_name)
+        if group:
+            expired = [channel for channel in group if channel._is_expired()]
+            if expired:
+                group.difference_update(expired)
+        channels = tuple(group) if group else ()
+        if not channels:
+            return GroupSendStatusEnum.NO_SUCH_GROUP
+        if not isinstance(payload, (str, bytes)) and all(
+            channel.payload_type == "json" for channel in channels
+        ):
+            # Serialize once for the whole group instead of once per channel.
+            if orjson is not None:
+                text = orjson.dumps(payload).decode()
+            else:
+                text = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+            sends = (channel._send_prepared(text) for channel in channels)
+        else:
+            sends = (channel._send(payload) for channel in channels)
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logging.debug(result)
+        return GroupSendStatusEnum.GROUP_SEND
 
     @classmethod
     async def show_groups(cls) -> typing.Dict[str, typing.Any]:
@@ -189,19 +256,17 @@ class ChannelBox:
     @classmethod
     async def flush_history(cls) -> None:
         cls.CHANNEL_GROUPS_HISTORY = {}
+        cls.CHANNEL_GROUPS_HISTORY_BYTES = {}
 
     @classmethod
     async def _clean_expired(cls) -> None:
         for group_name in list(cls.CHANNEL_GROUPS):
-            for channel in cls.CHANNEL_GROUPS.get(group_name, {}):
-                _is_expired = await channel._is_expired()
-                if _is_expired:
-                    try:
-                        del cls.CHANNEL_GROUPS[group_name][channel]
-                    except KeyError:
-                        logging.debug("No such channel")
-
-            if not any(cls.CHANNEL_GROUPS.get(group_name, {})):
+            group = cls.CHANNEL_GROUPS.get(group_name, set())
+            for channel in list(group):
+                if channel._is_expired():
+                    group.discard(channel)
+
+            if not cls.CHANNEL_GROUPS.get(group_name):
                 try:
                     del cls.CHANNEL_GROUPS[group_name]
                 except KeyError:
@@ -212,19 +277,28 @@ class ChannelBox:
         """
         Close all WebSocket connections in all groups.
         """
-        for group_name, channels in cls.CHANNEL_GROUPS.items():
-            for channel in list(
-                channels.keys()
-            ):  # Use list() to avoid RuntimeError due to dict size change
-                try:
-                    await channel.websocket.close()
-                    logging.debug(
-                        f"Closed connection for channel {channel.uuid} in group {group_name}"
-                    )
-                except Exception as e:
-                    logging.error(
-                        f"Failed to close connection for channel {channel.uuid}: {e}"
-                    )
-
+        # Snapshot and clear the registry up front, then close every
+        # connection concurrently instead of awaiting them one by one.
+        groups = list(cls.CHANNEL_GROUPS.items())
         cls.CHANNEL_GROUPS = {}
+
+        channels = [
+            (group_name, channel)
+            for group_name, group in groups
+            for channel in group
+        ]
+        results = await asyncio.gather(
+            *(channel.websocket.close() for _, channel in channels),
+            return_exceptions=True,
+        )
+        for (group_name, channel), result in zip(channels, results):
+            if isinstance(result, Exception):
+                logging.error(
+                    f"Failed to close connection for channel {channel.uuid}: {result}"
+                )
+            else:
+                logging.debug(
+                    f"Closed connection for channel {channel.uuid} in group {group_name}"
+                )
+
         logging.debug("All connections closed and groups cleared.")
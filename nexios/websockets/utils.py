@@ -1,9 +1,10 @@
+import itertools
+import time
 import typing
-import uuid
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
 from enum import Enum
-from uuid import UUID
+
+_next_seq = itertools.count().__next__
 
 
 class ChannelAddStatusEnum(Enum):
@@ -31,6 +32,14 @@ class PayloadTypeEnum(Enum):
 
 @dataclass
 class ChannelMessageDC:
+    """A single history entry.
+
+    The old class-level ``uuid.uuid4()`` / ``datetime.now()`` defaults were
+    evaluated once at import, so every message shared the same id and
+    timestamp. ``default_factory`` makes them per-instance, and a monotonic
+    sequence number plus ``time.time()`` float keeps history appends cheap.
+    """
+
     payload: typing.Union[str, bytes]
-    uuid: UUID = uuid.uuid4()
-    created: datetime = datetime.now(tz=timezone.utc)
+    uuid: int = field(default_factory=_next_seq)
+    created: float = field(default_factory=time.time)
@@ -0,0 +1,29 @@
+import pytest
+
+from nexios import get_application
+from nexios.config.base import MakeConfig
+from nexios.testing import Client
+
+
+@pytest.fixture(scope="session")
+def shared_app():
+    """Single application instance shared by test modules that opt in.
+
+    Modules register their routes under unique prefixes from a
+    module-scoped fixture, so one router/middleware graph serves the
+    whole run.
+    """
+    return get_application(MakeConfig({"secret_key": "1234"}))
+
+
+@pytest.fixture(scope="session")
+def shared_client(shared_app):
+    """One long-lived test client for the whole session.
+
+    Re-entering a fresh ``Client`` context per test repeats httpx setup
+    and teardown; reusing this instance reduces per-test isolation to a
+    cheap cookie reset.
+    """
+    # log_requests would write a formatted line to stderr per request;
+    # keep the hot test loop quiet.
+    return Client(shared_app, log_requests=False)
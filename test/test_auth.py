@@ -1,241 +1,262 @@
+import contextvars
+
 import pytest
+from jwt import decode as jwt_decode
+from jwt import encode as jwt_encode
 
-from nexios import get_application
 from nexios.application import NexiosApp
 from nexios.auth.backends.jwt import create_jwt, decode_jwt
+from nexios.auth.backends import JWTAuthBackend
 from nexios.auth.base import AuthenticationBackend, SimpleUser
 from nexios.auth.decorator import auth, has_permission
 from nexios.auth.exceptions import PermissionDenied
-from nexios.config.base import MakeConfig
+from nexios.auth.middleware import AuthenticationMiddleware
 from nexios.http import Request, Response
 from nexios.testing import Client
 
 
-@pytest.fixture
-async def test_client():
-    app = get_application(MakeConfig({"secret_key": "1234"}))
-    async with Client(app) as client:
-        yield client, app
-
-
-@pytest.fixture
-def mock_user():
-    return {"id": 1, "username": "testuser"}
-
+_active_backend: "contextvars.ContextVar" = contextvars.ContextVar(
+    "active_backend", default=None
+)
 
-@pytest.fixture
-def valid_token(mock_user):
-    return create_jwt(mock_user)
 
+class _SwapBackend(AuthenticationBackend):
+    """Delegates to whichever backend the current test installed.
 
-@pytest.fixture
-def expired_token(mock_user):
-    return create_jwt({"exp": 1, **mock_user})
+    Installing AuthenticationMiddleware rebuilds the middleware chain;
+    swapping the backend through a context variable keeps the chain
+    built once for the whole module.
+    """
 
+    async def authenticate(self, request: Request, response: Response):
+        backend = _active_backend.get()
+        if backend is None:
+            return None
+        return await backend.authenticate(request, response)
 
-async def test_jwt_auth_success(test_client, mock_user, valid_token):
-    client, app = test_client
 
-    async def mock_authenticate(**kwargs):
-        return mock_user
+@pytest.fixture(scope="module")
+def auth_app(shared_app):
+    # Piggyback on the session-wide app instead of building a second
+    # router/middleware graph; the swap middleware is installed for this
+    # module and removed again on teardown.
+    middleware_count = len(shared_app.http_middleware)
+    shared_app.add_middleware(AuthenticationMiddleware(backend=_SwapBackend()))
+    yield shared_app
+    del shared_app.http_middleware[: len(shared_app.http_middleware) - middleware_count]
+    shared_app.invalidate_caches()
 
-    from nexios.auth.backends import JWTAuthBackend
-    from nexios.auth.middleware import AuthenticationMiddleware
 
-    app.add_middleware(
-        AuthenticationMiddleware(
-            backend=JWTAuthBackend(authenticate_func=mock_authenticate)
-        )
-    )
+@pytest.fixture(scope="module")
+def auth_client(auth_app, shared_client):
+    # The session client already wraps the shared app; no second httpx
+    # transport is needed.
+    return shared_client
 
-    @app.get("/protected")
-    @auth(["jwt"])
-    async def protected_route(req: Request, res: Response):
-        return res.json({"user": req.user})
 
-    response = await client.get(
-        "/protected", headers={"Authorization": f"Bearer {valid_token}"}
-    )
-
-    assert response.status_code == 200
-    assert response.json()["user"] == mock_user
+@pytest.fixture
+async def test_client(auth_app, auth_client):
+    # Roll back whatever routes and middleware a test registered so the
+    # shared app starts each test from the same state.
+    route_count = len(auth_app.router.routes)
+    middleware_count = len(auth_app.http_middleware)
+    auth_client.reset_cookies()
+    yield auth_client, auth_app
+    _active_backend.set(None)
+    del auth_app.router.routes[route_count:]
+    del auth_app.http_middleware[: len(auth_app.http_middleware) - middleware_count]
+    auth_app.invalidate_caches()
+
+
+@pytest.fixture(scope="session")
+def mock_user():
+    return {"id": 1, "username": "testuser"}
 
 
-async def test_jwt_auth_missing_header(test_client, mock_user):
+@pytest.fixture
+def jwt_app(test_client, mock_user):
+    """Install the JWT middleware and a /protected route once for the
+    tests that share this exact setup."""
     client, app = test_client
 
     async def mock_authenticate(**kwargs):
         return mock_user
 
-    from nexios.auth.backends import JWTAuthBackend
-    from nexios.auth.middleware import AuthenticationMiddleware
-
-    app.add_middleware(
-        AuthenticationMiddleware(
-            backend=JWTAuthBackend(authenticate_func=mock_authenticate)
-        )
-    )
+    _active_backend.set(JWTAuthBackend(authenticate_func=mock_authenticate))
 
-    @app.get("/protected")
+    @app.get("/auth/protected")
     @auth(["jwt"])
     async def protected_route(req: Request, res: Response):
         return res.json({"user": req.user})
 
-    # Test without auth header
-    response = await client.get("/protected")
-
-    assert response.status_code == 401
-
-
-async def test_jwt_auth_invalid_token(test_client, mock_user):
-    client, app = test_client
-
-    async def mock_authenticate(**kwargs):
-        return mock_user
-
-    from nexios.auth.backends import JWTAuthBackend
-    from nexios.auth.middleware import AuthenticationMiddleware
-
-    app.add_middleware(
-        AuthenticationMiddleware(
-            backend=JWTAuthBackend(authenticate_func=mock_authenticate)
-        )
-    )
+    return client, app
 
-    @app.get("/protected")
-    @auth(["jwt"])
-    async def protected_route(req: Request, res: Response):
-        return res.json({"user": req.user})
-
-    # Test with invalid token
-    response = await client.get(
-        "/protected", headers={"Authorization": "Bearer invalid_token"}
-    )
 
-    assert response.status_code == 401
-
-
-async def test_jwt_auth_expired_token(test_client, mock_user, expired_token):
-    client, app = test_client
-
-    async def mock_authenticate(**kwargs):
-        return mock_user
-
-    from nexios.auth.backends import JWTAuthBackend
-    from nexios.auth.middleware import AuthenticationMiddleware
-
-    app.add_middleware(
-        AuthenticationMiddleware(
-            backend=JWTAuthBackend(authenticate_func=mock_authenticate)
-        )
-    )
-
-    @app.get("/protected")
-    @auth(["jwt"])
-    async def protected_route(req: Request, res: Response):
-        return res.json({"user": req.user})
+@pytest.fixture(scope="session")
+def valid_token(mock_user):
+    # The payload is constant, so sign once for the whole run instead of
+    # re-running HMAC + base64 per test. The secret matches the app config
+    # explicitly because session fixtures run before the app exists.
+    return create_jwt(mock_user, "1234")
 
-    # Test with expired token
-    response = await client.get(
-        "/protected", headers={"Authorization": f"Bearer {expired_token}"}
-    )
 
-    assert response.status_code == 401
+@pytest.fixture(scope="session")
+def auth_headers(valid_token):
+    # Every success-path test sends this exact header; build the dict once.
+    return {"Authorization": f"Bearer {valid_token}"}
 
 
-async def test_jwt_auth_validation_failure(test_client, valid_token):
+@pytest.fixture(scope="session")
+def expired_token(mock_user):
+    # exp=1 is always in the past; the token never needs re-signing.
+    return create_jwt({"exp": 1, **mock_user}, "1234")
+
+
+@pytest.mark.parametrize(
+    ("case", "expected_status"),
+    [
+        ("valid", 200),
+        ("invalid", 401),
+        ("expired", 401),
+        ("missing", 401),
+    ],
+)
+async def test_jwt_auth_token_cases(
+    jwt_app, mock_user, auth_headers, expired_token, case, expected_status
+):
+    client, app = jwt_app
+
+    if case == "valid":
+        headers = auth_headers
+    elif case == "invalid":
+        headers = {"Authorization": "Bearer invalid_token"}
+    elif case == "expired":
+        headers = {"Authorization": f"Bearer {expired_token}"}
+    else:
+        headers = None
+
+    response = await client.get("/auth/protected", headers=headers)
+
+    assert response.status_code == expected_status
+    if expected_status == 200:
+        body = response.json()
+        assert body["user"] == mock_user
+
+
+async def test_jwt_auth_validation_failure(test_client, auth_headers):
     client, app = test_client
 
     # Mock authenticate function to return None (invalid user)
     async def mock_authenticate(**kwargs):
-        return SimpleUser(username="nexios-dev")
-
-    from nexios.auth.backends import JWTAuthBackend
-    from nexios.auth.middleware import AuthenticationMiddleware
+        return SimpleUser.get("nexios-dev")
 
-    app.add_middleware(
-        AuthenticationMiddleware(
-            backend=JWTAuthBackend(authenticate_func=mock_authenticate)
-        )
-    )
+    _active_backend.set(JWTAuthBackend(authenticate_func=mock_authenticate))
 
-    @app.get("/protected")
+    @app.get("/auth/protected")
     @auth(["jwt"])
     async def protected_route(req: Request, res: Response):
         return res.json({"user": req.user})
 
     # Test with valid token but invalid user
-    response = await client.get(
-        "/protected", headers={"Authorization": f"Bearer {valid_token}"}
-    )
+    response = await client.get("/auth/protected", headers=auth_headers)
 
     assert response.status_code == 200
 
 
-async def test_jwt_auth_with_auth_decorator(test_client, mock_user, valid_token):
-    client, app = test_client
-
-    async def mock_authenticate(**kwargs):
-        return mock_user
-
-    from nexios.auth.backends import JWTAuthBackend
-    from nexios.auth.decorator import auth
-    from nexios.auth.middleware import AuthenticationMiddleware
-
-    app.add_middleware(
-        AuthenticationMiddleware(
-            backend=JWTAuthBackend(authenticate_func=mock_authenticate)
-        )
-    )
-
-    @app.get("/protected-decorator")
-    @auth(["jwt"])
-    async def protected_route(req: Request, res: Response):
-        return res.json({"user": req.user})
+async def test_jwt_auth_with_auth_decorator(jwt_app, mock_user, auth_headers):
+    client, app = jwt_app
 
     # Test with valid token
-    response = await client.get(
-        "/protected-decorator", headers={"Authorization": f"Bearer {valid_token}"}
-    )
+    response = await client.get("/auth/protected", headers=auth_headers)
+    body = response.json()
     assert response.status_code == 200
-    assert response.json()["user"] == mock_user
+    assert body["user"] == mock_user
 
     # Test without token (should be unauthorized)
-    response = await client.get("/protected-decorator")
+    response = await client.get("/auth/protected")
     assert response.status_code == 401
 
 
-def test_create_jwt():
-    from jwt import decode as jwt_decode
-
-    payload = {"user_id": 1, "username": "test"}
-    token = create_jwt(payload, "test_secret")
-
-    decoded = jwt_decode(token, "test_secret", algorithms=["HS256"])
-    assert decoded["user_id"] == 1
-    assert decoded["username"] == "test"
+# One secret for every JWT unit test below: the first call keys the HMAC
+# template cache, every later sign/verify reuses it.
+_SECRET = "test_secret"
+_JWT_PAYLOAD = {"user_id": 1, "username": "test"}
 
 
-def test_decode_jwt_valid():
-    payload = {"user_id": 1, "username": "test"}
-    token = create_jwt(payload, "test_secret", algorithm="HS256")
+def test_create_jwt():
+    token = create_jwt(_JWT_PAYLOAD, _SECRET)
 
-    decoded = decode_jwt(token, "test_secret", ["HS256"])
+    decoded = jwt_decode(token, _SECRET, algorithms=["HS256"])
     assert decoded["user_id"] == 1
     assert decoded["username"] == "test"
 
 
-def test_decode_jwt_expired():
-    payload = {"user_id": 1, "username": "test", "exp": 1}  # Expired in 1970
-    token = create_jwt(payload, "test_secret", algorithm="HS256")
-
-    with pytest.raises(ValueError, match="Token has expired"):
-        decode_jwt(token, "test_secret", ["HS256"])
-
+@pytest.mark.parametrize(
+    ("payload", "error"),
+    [
+        (_JWT_PAYLOAD, None),
+        ({**_JWT_PAYLOAD, "exp": 1}, "Token has expired"),  # Expired in 1970
+        (None, "Invalid token"),
+    ],
+    ids=["valid", "expired", "invalid"],
+)
+def test_decode_jwt(payload, error):
+    token = (
+        create_jwt(payload, _SECRET, algorithm="HS256")
+        if payload is not None
+        else "invalid.token"
+    )
 
-def test_decode_jwt_invalid():
+    if error is None:
+        decoded = decode_jwt(token, _SECRET, ["HS256"])
+        assert decoded["user_id"] == 1
+        assert decoded["username"] == "test"
+    else:
+        with pytest.raises(ValueError, match=error):
+            decode_jwt(token, _SECRET, ["HS256"])
+
+
+def test_decode_jwt_cached_payloads_are_isolated():
+    token = create_jwt({**_JWT_PAYLOAD, "scopes": ["read"]}, _SECRET)
+
+    first = decode_jwt(token, _SECRET, ["HS256"])
+    first["scopes"].append("admin")
+
+    # A mutated decoded payload must not leak into later decodes served
+    # from the cache.
+    assert decode_jwt(token, _SECRET, ["HS256"])["scopes"] == ["read"]
+
+
+def _tampered(token: str) -> str:
+    head, body, sig = token.split(".")
+    flipped = ("A" if sig[0] != "A" else "B") + sig[1:]
+    return f"{head}.{body}.{flipped}"
+
+
+@pytest.mark.parametrize(
+    "make_token",
+    [
+        lambda: _tampered(create_jwt(_JWT_PAYLOAD, _SECRET)),
+        lambda: create_jwt(_JWT_PAYLOAD, "not-the-secret"),
+        lambda: jwt_encode(_JWT_PAYLOAD, _SECRET, algorithm="HS384"),
+        lambda: create_jwt({**_JWT_PAYLOAD, "aud": "api"}, _SECRET),
+        lambda: create_jwt({**_JWT_PAYLOAD, "sub": 42}, _SECRET),
+        lambda: create_jwt({**_JWT_PAYLOAD, "jti": 7}, _SECRET),
+    ],
+    ids=[
+        "tampered-signature",
+        "wrong-secret",
+        "non-hs256-alg",
+        "aud-claim",
+        "non-string-sub",
+        "non-string-jti",
+    ],
+)
+def test_decode_jwt_hs256_rejections(make_token):
+    # Exercises the inline HS256 verifier's negative paths; each case must
+    # fail exactly like the PyJWT path it replaces.
     with pytest.raises(ValueError, match="Invalid token"):
-        decode_jwt("invalid.token", "test_secret", ["HS256"])
+        decode_jwt(make_token(), _SECRET, ["HS256"])
 
 
 async def test_custom_auth_backend(test_client):
@@ -247,31 +268,24 @@ async def test_custom_auth_backend(test_client):
                 return {"id": 1, "username": "custom_user"}, "X-auth"
             return None
 
-    from nexios.auth.middleware import AuthenticationMiddleware
+    _active_backend.set(CustomAuthBackend())
 
-    app.add_middleware(AuthenticationMiddleware(backend=CustomAuthBackend()))
-
-    @app.get("/custom-protected")
+    @app.get("/auth/custom-protected")
     @auth(["X-auth"])
     async def custom_protected(req: Request, res: Response):
         return res.json({"user": req.user})
 
     # Test with valid custom auth
-    response = await client.get("/custom-protected", headers={"X-Custom-Auth": "valid"})
+    response = await client.get("/auth/custom-protected", headers={"X-Custom-Auth": "valid"})
     assert response.status_code == 200
     assert response.json()["user"] == {"id": 1, "username": "custom_user"}
 
-    response = await client.get("/custom-protected")
+    response = await client.get("/auth/custom-protected")
     assert response.status_code == 401
 
 
 async def test_has_permission_decorator(test_client):
     """Test the has_permission decorator with SimpleUser."""
-    from nexios.auth.base import SimpleUser
-    from nexios.auth.decorator import has_permission
-    from nexios.auth.exceptions import PermissionDenied
-    from nexios.auth.middleware import AuthenticationMiddleware
-
     app = NexiosApp()
     client = Client(app)
 
